@@ -1,5 +1,6 @@
 """Defines classes related to the Factory pattern."""
 
+import sys
 from types import NoneType
 from typing import (
     Any,
@@ -30,6 +31,8 @@ class RegistryFactory(Generic[_TargetClassT]):
     #FUTURE: However, mypy 1.10.0 cannot catch wrong classes being registered. yet.
     """
 
+    __slots__ = ('_registry',)
+
     def __init__(self) -> None:
         self._registry: Dict[str, Type[_TargetClassT]] = {}
 
@@ -55,25 +58,41 @@ class RegistryFactory(Generic[_TargetClassT]):
 
         Parentheses for this decorator can be omitted.
         """
+        if isinstance(argument, type):
+            return self._add(argument.__name__, argument)
 
-        def _wrapper(target: Type[_TargetClassT]) -> Type[_TargetClassT]:
-            key_name = target.__name__ if name is None else name
+        return self.register_as(argument)
 
-            assert (
-                key_name not in self._registry
-            ), f"Name ({key_name}) already registered."
+    @class_decorator
+    def register_as(
+        self, name: Optional[str] = None
+    ) -> Callable[[Type[_TargetClassT]], Type[_TargetClassT]]:
+        """
+        Decorate class to register with a name.
 
-            self._registry[key_name] = target
-            return target
+        Same as `register()` with parentheses.
 
-        if isinstance(argument, type):
-            target = argument
-            name = None
-            return _wrapper(target)
+        :param name: Name for the class that is to be specified for creation.
+          If `None`, the name of the class will be used.
+        """
+
+        def _wrapper(target: Type[_TargetClassT]) -> Type[_TargetClassT]:
+            return self._add(target.__name__ if name is None else name, target)
 
-        name = argument
         return _wrapper
 
+    def _add(self, key_name: str, target: Type[_TargetClassT]) -> Type[_TargetClassT]:
+        # Interned, so that lookups with literal names can compare by identity.
+        # `sys.intern()` rejects subclasses of `str`, e.g. `enum.StrEnum`.
+        if type(key_name) is str:  # noqa: E721
+            key_name = sys.intern(key_name)
+
+        registered = self._registry.setdefault(key_name, target)
+
+        assert registered is target, f"Name ({key_name}) already registered."
+
+        return target
+
     def create(
         self, name: str, arguments: Optional[Dict[str, Any]] = None
     ) -> _TargetClassT:
@@ -84,12 +103,24 @@ class RegistryFactory(Generic[_TargetClassT]):
         :param arguments: Key/value pairs to be passed to the initializer as
           arguments. `None` for no arguments.
         :raises: `KeyError`: `name` doesn't exist.
-        """
-        if arguments is None:
-            arguments = {}
 
+        .. note:: Registered names are interned. Lookup is fastest when `name`
+          is interned as well, as string literals are.
+        """
         target = self._registry[name]
-        return target(**arguments)
+        return target() if arguments is None else target(**arguments)
+
+    def get_constructor(self, name: str) -> Type[_TargetClassT]:
+        """
+        Return class registered to this registry.
+
+        For creating many instances of the same class without looking up
+        `name` each time.
+
+        :param name: Name for the class specified with `register()`.
+        :raises: `KeyError`: `name` doesn't exist.
+        """
+        return self._registry[name]
 
 
 _TargetSignature = TypeVar('_TargetSignature')
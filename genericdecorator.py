@@ -7,15 +7,18 @@ Declares features for implementing decorators.
 """
 
 from functools import (
+    partial,
     wraps,
 )
-import inspect
+from types import FunctionType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
-    Generic,
+    ClassVar,
+    Dict,
+    NoReturn,
     Optional,
-    Protocol,
     Type,
     TypeVar,
     Union,
@@ -45,35 +48,25 @@ TargetT = TypeVar('TargetT', Callable[..., Any], Type[object])
 """Type for decorated function or class"""
 
 
-class TargetFunctionWrapper(Protocol[TargetReturnT]):
-    """
-    Generic type for function that calls the decorated function.
-
-    :param TargetReturnT: Return type of the decorated function.
-    """
+# Not `Protocol`s, which are costly to subscript. `Concatenate` is not used to
+# declare the first arguments, because it would make them positional-only.
+TargetFunctionWrapper = Callable[..., TargetReturnT]
+"""
+Generic type for function that calls the decorated function.
 
-    # Callable[[TargetFunctionT, ...], TargetReturnT]
-    def __call__(  # noqa: D102  # D105 doesn't seem to work here
-        self, target: Callable[..., TargetReturnT], *vals: Any, **kwargs: Any
-    ) -> TargetReturnT: ...
+Called as `wrapper(target, *vals, **kwargs)`.
 
+:param TargetReturnT: Return type of the decorated function.
+"""
 
-class TargetMethodWrapper(Protocol, Generic[TargetReturnT, TargetClassT_contra]):
-    """
-    Generic type for function that calls the decorated method.
+TargetMethodWrapper = Callable[..., TargetReturnT]
+"""
+Generic type for function that calls the decorated method.
 
-    :param TargetReturnT: Return type of the decorated method.
-    """
+Called as `wrapper(target, instance, cls, *vals, **kwargs)`.
 
-    # Callable[[TargetFunctionT, ...], TargetReturnT]
-    def __call__(  # noqa: D102  # D105 doesn't seem to work here
-        self,
-        target: Callable[..., TargetReturnT],
-        instance: TargetClassT_contra,
-        cls: Type[TargetClassT_contra],
-        *vals: Any,
-        **kwargs: Any,
-    ) -> TargetReturnT: ...
+:param TargetReturnT: Return type of the decorated method.
+"""
 
 
 # Alias currently doesn't work https://github.com/python/mypy/issues/8273
@@ -97,6 +90,49 @@ To be used if the wrapped class has the same methods as the target class.
 """
 
 
+class _MethodPartial(partial):  # type: ignore[type-arg]
+    # `functools.partial` that takes `__name__` and `__doc__` from the method,
+    # so that `help()` and logging see the method rather than `partial`.
+    # No docstring, because `__doc__` is a property.
+
+    @property
+    def __name__(self) -> str:
+        return cast(str, self.args[0].__name__)
+
+    @property
+    def __doc__(self) -> Optional[str]:  # type: ignore[override]
+        return cast(Optional[str], self.args[0].__doc__)
+
+
+class _DescriptorForAllMethods:
+    """
+    Descriptor for methods of classes decorated with :class:`GenericDecorator`.
+
+    Defined at module level, so that classes are not created for each
+    decorated class.
+
+    :param method: The method to be decorated.
+    :param wrapper: Function that calls `method`.
+    """
+
+    def __init__(
+        self,
+        method: Any,  # function, `staticmethod` or `classmethod`  # noqa: ANN401
+        wrapper: TargetMethodWrapper[Any],  # TargetReturnT
+    ) -> None:
+        self.method = method
+        self.wrapper = wrapper
+
+    def __get__(
+        self, instance: TargetClassT, owner: Type[TargetClassT]
+    ) -> TargetFunctionWrapper[Any]:  # TargetReturnT
+        # TargetFunction[TargetReturnT]
+        function = self.method.__get__(instance, owner)
+
+        # `partial` is implemented in C. Cheaper to create and call than a closure.
+        return _MethodPartial(self.wrapper, function, instance, owner)
+
+
 class GenericDecorator:
     r"""
     A convenience class for creating decorators.
@@ -148,15 +184,9 @@ class GenericDecorator:
     def __init__(
         self,
         wrapper_for_function: TargetFunctionWrapper[TargetReturnT],
-        wrapper_for_instancemethod: Optional[
-            TargetMethodWrapper[TargetReturnT, TargetClassT]
-        ] = None,
-        wrapper_for_staticmethod: Optional[
-            TargetMethodWrapper[TargetReturnT, TargetClassT]
-        ] = None,
-        wrapper_for_classmethod: Optional[
-            TargetMethodWrapper[TargetReturnT, TargetClassT]
-        ] = None,
+        wrapper_for_instancemethod: Optional[TargetMethodWrapper[TargetReturnT]] = None,
+        wrapper_for_staticmethod: Optional[TargetMethodWrapper[TargetReturnT]] = None,
+        wrapper_for_classmethod: Optional[TargetMethodWrapper[TargetReturnT]] = None,
     ) -> None:
         # Attempt to use this class also as a context manager (for use with
         # `with` statements) has been abandoned, because:
@@ -181,25 +211,37 @@ class GenericDecorator:
             return wrapper_for_function(target, *args, **kwargs)
 
         self.wrapper_for_function = wrapper_for_function
-        self.wrapper_for_instancemethod: TargetMethodWrapper[
-            TargetReturnT, TargetClassT
-        ] = wrapper_for_instancemethod or default_wrapper
-        self.wrapper_for_staticmethod: TargetMethodWrapper[
-            TargetReturnT, TargetClassT
-        ] = wrapper_for_staticmethod or default_wrapper
-        self.wrapper_for_classmethod: TargetMethodWrapper[
-            TargetReturnT, TargetClassT
-        ] = wrapper_for_classmethod or default_wrapper
-
-    @overload
-    def __call__(
-        self, target: None
-    ) -> Union[
-        FunctionWrapperFactory[TargetFunctionT], ClassWrapperFactory[TargetClassT]
-    ]: ...
-
-    @overload
-    def __call__(self, target: TargetT) -> TargetT: ...
+        self.wrapper_for_instancemethod: TargetMethodWrapper[TargetReturnT] = (
+            wrapper_for_instancemethod or default_wrapper
+        )
+        self.wrapper_for_staticmethod: TargetMethodWrapper[TargetReturnT] = (
+            wrapper_for_staticmethod or default_wrapper
+        )
+        self.wrapper_for_classmethod: TargetMethodWrapper[TargetReturnT] = (
+            wrapper_for_classmethod or default_wrapper
+        )
+
+        # Wrappers for attributes of decorated classes, looked up by exact type
+        # before falling back to `isinstance()`.
+        # Functions in `__dict__` of classes are instance methods, because
+        # they aren't bound yet.
+        self._method_wrappers: Dict[type, TargetMethodWrapper[TargetReturnT]] = {
+            FunctionType: self.wrapper_for_instancemethod,
+            staticmethod: self.wrapper_for_staticmethod,
+            classmethod: self.wrapper_for_classmethod,
+        }
+
+    if TYPE_CHECKING:  # Not to define overloads at runtime
+
+        @overload
+        def __call__(
+            self, target: None
+        ) -> Union[
+            FunctionWrapperFactory[TargetFunctionT], ClassWrapperFactory[TargetClassT]
+        ]: ...
+
+        @overload
+        def __call__(self, target: TargetT) -> TargetT: ...
 
     def __call__(self, target: Optional[TargetT] = None) -> Any:
         # FUTURE: Unions don't work with `TypeVar` (mypy 0.800)
@@ -217,138 +259,85 @@ class GenericDecorator:
         with arguments.
         Return `self(target)` when there are no arguments.
         """
-
-        def _make_class_decorator(
-            target_class: Type[TargetClassT],
-        ) -> Type[TargetClassT]:
-            class Descriptor(Protocol):
-                """Protocol for descriptor."""
-
-                def __get__(  # type: ignore[empty-body]  # mypy 1.0.1 problem
-                    self, instance: TargetClassT, owner: Type[TargetClassT]
-                ) -> TargetFunctionWrapper[Any]: ...  # TargetReturnT
-
-            class DescriptorForAllMethods:
-                """Descriptor super class."""
-
-                def __init__(
-                    self,
-                    method: Descriptor,
-                    wrapper: TargetMethodWrapper[Any, TargetClassT],  # TargetReturnT
-                ) -> None:
-                    self.method = method
-                    self.wrapper = wrapper
-
-                def __get__(
-                    self, instance: TargetClassT, owner: Type[TargetClassT]
-                ) -> TargetFunctionWrapper[Any]:  # TargetReturnT
-                    def call_wrapper(
-                        *args: Any, **kwargs: Any
-                    ) -> Any:  # TargetReturnT  # noqa: ANN401
-                        return self.wrapper(function, instance, owner, *args, **kwargs)
-
-                    # TargetFunction[TargetReturnT]
-                    function = self.method.__get__(instance, owner)
-                    return call_wrapper
-
-            class DescriptorForInstanceMethod(DescriptorForAllMethods):
-                # pylint: disable=too-few-public-methods
-                """Descriptor to be used for instance method."""
-
-                def __init__(
-                    self,
-                    method: Descriptor,
-                ) -> None:
-                    super().__init__(method, decorator_self.wrapper_for_instancemethod)
-
-            class DescriptorForStaticmethod(DescriptorForAllMethods):
-                # pylint: disable=too-few-public-methods
-                """Descriptor to be used for staticmethod."""
-
-                def __init__(
-                    self,
-                    # FUTURE:  Adding [TargetReturnT] doesn't run yet.
-                    method: staticmethod,  # type: ignore[type-arg]
-                ) -> None:
-                    super().__init__(
-                        # `staticmethod` is descriptor
-                        method,  # type: ignore[pylance, unused-ignore]  # v2024.2.1
-                        decorator_self.wrapper_for_staticmethod,
-                    )
-
-            class DescriptorForClassmethod(DescriptorForAllMethods):
-                # pylint: disable=too-few-public-methods
-                """Descriptor to be used for classmethod."""
-
-                def __init__(
-                    self,
-                    # FUTURE:  Adding [TargetReturnT] doesn't run yet.
-                    method: classmethod,  # type: ignore[type-arg]
-                ) -> None:
-                    super().__init__(
-                        # `classmethod` is descriptor
-                        method,  # type: ignore[pylance, unused-ignore] # v2024.2.1
-                        decorator_self.wrapper_for_classmethod,
-                    )
-
-            for name, value in target_class.__dict__.items():
-                # not `ismethod()` because not bound
-                if inspect.isfunction(value):
-                    descriptor_method = DescriptorForInstanceMethod(
-                        # `FunctionType` is descriptor
-                        value  # type: ignore[pylance, unused-ignore] # v2024.2.1
-                    )
-                    setattr(target_class, name, descriptor_method)
-
-                elif isinstance(value, staticmethod):
-                    descriptor_static = DescriptorForStaticmethod(value)
-                    setattr(target_class, name, descriptor_static)
-
-                elif isinstance(value, classmethod):
-                    descriptor_class = DescriptorForClassmethod(value)
-                    setattr(target_class, name, descriptor_class)
-                # endif
-
-            return target_class
-
-        @wraps(target)  # type: ignore[arg-type]  # mypy: 1.8
-        def factory_for_target(
-            *args: Any, **kwargs: Any
-        ) -> Any:  # TargetReturnT:  # noqa: ANN401
-            return cast(  # cast from another TargetReturnT
-                Any,  # TargetReturnT,
-                decorator_self.wrapper_for_function(
-                    cast(Any, target),
-                    *args,
-                    **kwargs,  # cast to another TargetReturnT
-                ),
-            )
-
         if target is None:
             # https://stackoverflow.com/q/653368/2400328
             # @synchronized_on_instance(...) with parentheses
             return self
 
-        decorator_self = self
+        # One lookup for the usual types of targets, instead of `isinstance()`s
+        decorate = self._DECORATE_BY_TYPE.get(type(target))
+        if decorate is not None:
+            return decorate(self, target)
 
         if isinstance(target, type):
             # Type[TargetClassT]
-
-            return _make_class_decorator(
-                cast(type[object], target)  # type: ignore[redundant-cast] # mypy: 1.8
-            )
-
-        if callable(target):
-            return factory_for_target  # type: ignore[pylance, unused-ignore] # v2024.2.1
+            return self._decorate_class(target)
 
         if isinstance(target, staticmethod):
-            # https://stackoverflow.com/a/5345526/2400328
-            raise AssertionError("Put decorator after @staticmethod")  # noqa: TRY004
+            self._reject_staticmethod(target)
 
         if isinstance(target, classmethod):
-            raise AssertionError("Put decorator after @classmethod")  # noqa: TRY004
+            self._reject_classmethod(target)
+
+        if callable(target):
+            return self._decorate_function(target)
 
         raise AssertionError(
             f"Unsupported target of type: {type(target)!r}\n"
             "(You could have forgotten argument to decorator.)"
         )
+
+    def _decorate_function(
+        self, target: Callable[..., Any]
+    ) -> Callable[..., Any]:  # TargetFunctionT
+        # Bound to locals, so that calls don't look them up.
+        wrapper_for_function = self.wrapper_for_function
+        function: Any = target  # TargetFunctionT
+
+        @wraps(function)
+        def factory_for_target(
+            *args: Any, **kwargs: Any
+        ) -> Any:  # TargetReturnT:  # noqa: ANN401
+            return wrapper_for_function(function, *args, **kwargs)
+
+        return factory_for_target
+
+    def _decorate_class(self, target_class: Type[TargetClassT]) -> Type[TargetClassT]:
+        method_wrappers = self._method_wrappers
+
+        # Copied, because attributes are replaced while iterating
+        for name, value in list(target_class.__dict__.items()):
+            wrapper = method_wrappers.get(type(value))
+            if wrapper is None:
+                # Subclasses, e.g. `abc.abstractclassmethod`
+                if isinstance(value, staticmethod):
+                    wrapper = self.wrapper_for_staticmethod
+
+                elif isinstance(value, classmethod):
+                    wrapper = self.wrapper_for_classmethod
+                # endif
+
+            if wrapper is not None:
+                # `FunctionType`, `staticmethod` and `classmethod` are descriptors
+                descriptor = _DescriptorForAllMethods(value, wrapper)
+                setattr(target_class, name, descriptor)
+            # endif
+
+        return target_class
+
+    def _reject_staticmethod(self, target: object) -> NoReturn:  # noqa: ARG002
+        # https://stackoverflow.com/a/5345526/2400328
+        raise AssertionError("Put decorator after @staticmethod")
+
+    def _reject_classmethod(self, target: object) -> NoReturn:  # noqa: ARG002
+        raise AssertionError("Put decorator after @classmethod")
+
+    # `staticmethod` needs to be rejected before checking `callable()`, which
+    # is `True` for it since Python 3.10.
+    _DECORATE_BY_TYPE: ClassVar[Dict[type, Callable[[Any, Any], Any]]] = {
+        FunctionType: _decorate_function,
+        type: _decorate_class,
+        staticmethod: _reject_staticmethod,
+        classmethod: _reject_classmethod,
+    }
+    """Functions to decorate targets, by exact type of target."""
@@ -411,9 +411,72 @@ def test__pass_args__method_types() -> None:
         }
 
 
+@pytest.mark.parametrize('method_decorator', (staticmethod, classmethod))
+def test__pass_args__decorator_order(method_decorator: Callable[..., Any]) -> None:
+    """Test that decorating `staticmethod` or `classmethod` is rejected."""
+    with pytest.raises(AssertionError):
+
+        class _Class:
+            @pass_args
+            @method_decorator
+            def method(*_args: Any) -> None: ...
+
+
 # log_calls ###
 
 
+def test__log_calls__method_attributes() -> None:
+    """Test `__name__` and `__doc__` of methods of a decorated class."""
+
+    @log_calls(logger)
+    class _Class:
+        def method(self) -> None:
+            """Docstring of method."""
+
+        @staticmethod
+        def static_method() -> None:
+            """Docstring of static method."""
+
+    instance = _Class()
+
+    assert instance.method.__name__ == 'method'
+    assert instance.method.__doc__ == "Docstring of method."
+    assert _Class.static_method.__name__ == 'static_method'
+    assert _Class.static_method.__doc__ == "Docstring of static method."
+
+
+def test__log_calls__method_subclasses() -> None:
+    """Test that subclasses of `staticmethod` and `classmethod` are decorated."""
+
+    class _Staticmethod(staticmethod):  # type: ignore[type-arg]
+        pass
+
+    class _Classmethod(classmethod):  # type: ignore[type-arg]
+        pass
+
+    def _static_function() -> str:
+        return "static"
+
+    def _class_function(_cls: type, /) -> str:
+        return "class"
+
+    _logger = LogCapture(__name__)
+    _logger.setLevel(logging.INFO)
+
+    @log_calls(_logger, log_result=False)
+    class _Class:
+        static_method = _Staticmethod(_static_function)
+        class_method = _Classmethod(_class_function)
+
+    assert _Class.static_method() == "static"
+    assert _Class.class_method() == "class"
+
+    log_string = _logger.get_log()
+
+    assert "_static_function" in log_string
+    assert "_class_function" in log_string
+
+
 def test__log_calls__function_types() -> None:
     """Just want to see whether types of the target are respected."""
 
@@ -1,6 +1,8 @@
 """Test `factory.py`."""
 
 from collections.abc import Callable
+import copy
+import enum
 from typing import (
     Any,
     TypeAlias,
@@ -53,6 +55,40 @@ def test__RegistryFactory() -> None:
         assert instance.klass == klass
 
 
+def test__RegistryFactory__register_as() -> None:
+    """Test `RegistryFactory.register_as()`."""
+    registry = RegistryFactory[object]()
+
+    @registry.register_as("class")
+    class _Class: ...
+
+    @registry.register_as()
+    class _AnotherClass: ...
+
+    assert isinstance(registry.create("class"), _Class)
+    assert isinstance(registry.create("_AnotherClass"), _AnotherClass)
+
+    with pytest.raises(AssertionError):
+
+        @registry.register_as("class")
+        class _SameName: ...
+
+
+def test__RegistryFactory__StrEnum() -> None:
+    """Test that `RegistryFactory` accepts `str` subclasses as names."""
+
+    class _Kind(enum.StrEnum):
+        FOO = "foo"
+
+    registry = RegistryFactory[object]()
+
+    @registry.register(_Kind.FOO)
+    class _Class: ...
+
+    assert isinstance(registry.create("foo"), _Class)
+    assert isinstance(registry.create(_Kind.FOO), _Class)
+
+
 def test__RegistryFactory__KeyError() -> None:
     """Test that `RegistryFactory.create()` raises `KeyError`."""
     registry = RegistryFactory[object]()
@@ -64,6 +100,41 @@ def test__RegistryFactory__KeyError() -> None:
         _ = registry.create('none-existent')
 
 
+def test__RegistryFactory__get_constructor() -> None:
+    """Test `RegistryFactory.get_constructor()`."""
+    registry = RegistryFactory[object]()
+
+    @registry.register("class")
+    class _Class: ...
+
+    constructor = registry.get_constructor("class")
+
+    assert constructor is _Class
+    assert isinstance(constructor(), _Class)
+
+    with pytest.raises(KeyError):
+        _ = registry.get_constructor('none-existent')
+
+
+def test__RegistryFactory__deepcopy() -> None:
+    """Test that a deep copy of `RegistryFactory` has its own registry."""
+    registry = RegistryFactory[object]()
+
+    @registry.register
+    class _Class: ...
+
+    copied = copy.deepcopy(registry)
+
+    @copied.register
+    class _AnotherClass: ...
+
+    assert isinstance(copied.create("_Class"), _Class)
+    assert isinstance(copied.create("_AnotherClass"), _AnotherClass)
+
+    with pytest.raises(KeyError):
+        _ = registry.create("_AnotherClass")
+
+
 def test__FunctionRegistryFactory__function() -> None:
     """Test `FunctionRegistryFactory` with function."""
     FunctionSignature: TypeAlias = Callable[[int], str]
@@ -18,6 +18,9 @@ _logger = logging.getLogger(__name__)
 
 _ParameterT = TypeVar('_ParameterT')
 
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+"""Protocol for saving values. The highest is the most compact and fastest."""
+
 
 def make_filename(
     *,
@@ -79,7 +82,10 @@ def _save_or_load(
 
     try:
         with open(filename, 'rb') as read_file:
-            previous_value = pickle.load(read_file)  # noqa: S301
+            data = read_file.read()
+
+        # One read, instead of many small reads driven by `pickle.load()`
+        previous_value = pickle.loads(data)  # noqa: S301
 
     except OSError:
         if save:
@@ -91,7 +97,7 @@ def _save_or_load(
     if save:
         if previous_value != value:
             with open(filename, 'wb') as write_file:
-                pickle.dump(value, write_file)
+                pickle.dump(value, write_file, protocol=_PICKLE_PROTOCOL)
 
         return value
 